@@ -1,7 +1,6 @@
 import time
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 import math
 import argparse
@@ -15,6 +14,40 @@ def calculate_average_pixel_change(frame1, frame2):
     
     return avg_change
 
+def plot_pixel_changes(pixel_changes, times, output_plot):
+    """
+    Saves a histogram of the average pixel changes alongside a plot of the changes over time.
+
+    matplotlib is imported here rather than at the top of the module so that runs which
+    only need the clips do not pay its import cost.
+
+    Parameters:
+    pixel_changes (list): Average pixel change for each sampled frame.
+    times (list): Time in seconds of each sampled frame.
+    output_plot (str): Path to save the plot image.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 6))
+    
+    plt.subplot(1, 2, 1)
+    plt.hist(pixel_changes, bins=50, color='blue', alpha=0.7)
+    plt.xlabel('Average Pixel Change')
+    plt.ylabel('Frequency')
+    plt.title('Distribution of Average Pixel Change Between Consecutive Frames')
+    
+    plt.subplot(1, 2, 2)
+    plt.plot([x/60 for x in times], pixel_changes, color='red')
+    plt.xlabel('Time (minutes)')
+    plt.ylabel('Average Pixel Change')
+    plt.title('Average Pixel Change vs. Time')
+    
+    plt.tight_layout()
+    plt.savefig(output_plot)
+    plt.close()
+
 def process_video(video_path,
                   sample_rate=10,
                   end_time = None,
@@ -22,9 +55,11 @@ def process_video(video_path,
                   prefix='YH_',
                   filename='avg_pixel_change_plot.png',
                   clip_dir='clips/',
-                  threshold_devs=1):
+                  threshold_devs=1,
+                  plot=True):
     start = time.time()
-    os.makedirs(dir, exist_ok=True)
+    if plot:
+        os.makedirs(dir, exist_ok=True)
     # Open the video file
     video_name = video_path.split('/')[-1].split('.')[0]
     cap = cv2.VideoCapture(video_path)
@@ -78,23 +113,8 @@ def process_video(video_path,
     # Release the video capture object
     cap.release()
     # Plot the distribution of average pixel changes
-    plt.figure(figsize=(12, 6))
-    
-    plt.subplot(1, 2, 1)
-    plt.hist(pixel_changes, bins=50, color='blue', alpha=0.7)
-    plt.xlabel('Average Pixel Change')
-    plt.ylabel('Frequency')
-    plt.title('Distribution of Average Pixel Change Between Consecutive Frames')
-    
-    plt.subplot(1, 2, 2)
-    plt.plot([x/60 for x in times], pixel_changes, color='red')
-    plt.xlabel('Time (minutes)')
-    plt.ylabel('Average Pixel Change')
-    plt.title('Average Pixel Change vs. Time')
-    
-    output_plot = dir + prefix + filename
-    plt.tight_layout()
-    plt.savefig(output_plot)
+    if plot:
+        plot_pixel_changes(pixel_changes, times, dir + prefix + filename)
     
     ############################################################################
     ## THIS SECTION OF CODE CLIPS ALL SECTIONS THAT EXCEED THE MEAN + STD DEV ##
@@ -159,6 +179,7 @@ def process_video(video_path,
     return n_clips
 
 if __name__ == "__main__":
+    # These options are mirrored by the pixel-change subcommand in cli.py, keep both in sync
     parser = argparse.ArgumentParser(description="Process a video to calculate average pixel changes and extract clips with significant changes.")
     parser.add_argument("video_path", type=str, help="Path to the input video file ex. /mnt/c/Users/<username>/Downloads/<clip_name>.mp4")
     parser.add_argument("-s", "--sample_rate", type=int, default=150, help="Frame sampling rate (default: 150 (every 5 seconds @ 30fps))")
@@ -168,7 +189,8 @@ if __name__ == "__main__":
     parser.add_argument("-f","--filename", type=str, default="avg_pixel_change_plot.png", help="Filename for the plot (default: 'avg_pixel_change_plot.png')")
     parser.add_argument("-c","--clip_dir", type=str, default="clips/", help="Directory to save video clips (default: ''clips/')")
     parser.add_argument("-t","--threshold_devs", type=float, default=1, help="number of standard deviations above the mean to set the threshold (default = 1)")
+    parser.add_argument("-n","--no_plot", action="store_true", help="Skip saving the pixel change plot (avoids importing matplotlib)")
 
     args = parser.parse_args()
     
-    process_video(args.video_path, args.sample_rate, args.end_time, args.dir, args.prefix, args.filename, args.clip_dir, args.threshold_devs)
\ No newline at end of file
+    process_video(args.video_path, args.sample_rate, args.end_time, args.dir, args.prefix, args.filename, args.clip_dir, args.threshold_devs, not args.no_plot)
\ No newline at end of file
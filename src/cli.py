@@ -0,0 +1,128 @@
+import time
+_START = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+
+"""
+Image Processing CLI
+
+Single entry point for the scripts in this folder. Each subcommand only imports the module
+it needs once it has been selected, so launching e.g. `clip` does not pay for importing
+pandas or matplotlib. This matters when a SLURM array launches thousands of short jobs.
+
+Usage:
+    python cli.py <subcommand> [options]
+    python cli.py <subcommand> --help
+
+Subcommands:
+    pixel-change (calc_avg_pixel_change.py): Extract clips with large average pixel changes.
+    clip (clip_to_time_video.py): Clip a video between two times.
+    crop-video (crop_and_rotate_video.py): Crop and rotate a video.
+    crop-dataset (cropping_dataset.py): Crop images and update the CSV and HDF5 label files.
+    augment (image_augmentation.py): Augment an image dataset with color transformations.
+    pull-and-process (pull_and_process.py): Download videos with rclone and run pixel-change on them.
+
+Pass --timing before the subcommand to print the startup time (from cli.py being loaded
+through importing the subcommand's module) to stderr. For a per-module breakdown that also
+covers interpreter startup, run `python -X importtime cli.py <subcommand> ...`.
+"""
+
+
+def run_pixel_change(process_video, args):
+    process_video(args.video_path, args.sample_rate, args.end_time, args.dir, args.prefix, args.filename,
+                  args.clip_dir, args.threshold_devs, not args.no_plot)
+
+
+def run_clip(clip_to_time, args):
+    clip_to_time(args.video_path, args.start_time, args.end_time, args.output_path)
+
+
+def run_crop_video(crop_and_rotate_video, args):
+    crop_and_rotate_video(args.video_path, args.angle, args.x1, args.y1, args.x2, args.y2, args.output_name)
+
+
+def run_crop_dataset(crop_datasets, args):
+    crop_datasets(args.folder, args.angle, args.x1, args.y1, args.x2, args.y2, args.output_folder, args.dot_debug)
+
+
+def run_augment(augment_dataset, args):
+    augment_dataset(args.input_folder, args.output_folder, args.num_augmentations, args.include_grayscale, args.seed)
+
+
+def run_pull_and_process(main, args):
+    main()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run one of the image processing tools.")
+    parser.add_argument("--timing", action="store_true", help="Print the startup time of the subcommand to stderr.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Each subcommand records the module and function to import lazily, along with how to call it.
+    # Options mirror the argparse setup in each script's __main__ block, keep both in sync
+    sub = subparsers.add_parser("pixel-change", help="Extract clips with significant average pixel changes.")
+    sub.set_defaults(module="calc_avg_pixel_change", function="process_video", run=run_pixel_change)
+    sub.add_argument("video_path", type=str, help="Path to the input video file ex. /mnt/c/Users/<username>/Downloads/<clip_name>.mp4")
+    sub.add_argument("-s", "--sample_rate", type=int, default=150, help="Frame sampling rate (default: 150 (every 5 seconds @ 30fps))")
+    sub.add_argument("-e","--end_time", type=float, default=None, help="End time in seconds (default: None - end of video)")
+    sub.add_argument("-d","--dir", type=str, default="plots/", help="Directory to save plots (default: 'plots/')")
+    sub.add_argument("-p","--prefix", type=str, default="YH_", help="Prefix for clip filenames (make sure to add trailing '_' for readability) (default: 'YH_', ex. 'YH_s1_tr1_')")
+    sub.add_argument("-f","--filename", type=str, default="avg_pixel_change_plot.png", help="Filename for the plot (default: 'avg_pixel_change_plot.png')")
+    sub.add_argument("-c","--clip_dir", type=str, default="clips/", help="Directory to save video clips (default: 'clips/')")
+    sub.add_argument("-t","--threshold_devs", type=float, default=1, help="number of standard deviations above the mean to set the threshold (default = 1)")
+    sub.add_argument("-n","--no_plot", action="store_true", help="Skip saving the pixel change plot (avoids importing matplotlib)")
+
+    sub = subparsers.add_parser("clip", help="Clip a video between a start and end time.")
+    sub.set_defaults(module="clip_to_time_video", function="clip_to_time", run=run_clip)
+    sub.add_argument("video_path", type=str, help="Path to the input video file.")
+    sub.add_argument("start_time", type=float, help="Start time in seconds of the segment to clip.")
+    sub.add_argument("end_time", type=float, help="End time in seconds of the segment to clip.")
+    sub.add_argument("output_path", type=str, help="Path to save the clipped video segment.")
+
+    sub = subparsers.add_parser("crop-video", help="Crop and rotate a video.")
+    sub.set_defaults(module="crop_and_rotate_video", function="crop_and_rotate_video", run=run_crop_video)
+    sub.add_argument("video_path", type=str, help="Path to the input video file.")
+    sub.add_argument("x1", type=int, help="The x-coordinate of the top-left corner of the crop area post rotation.")
+    sub.add_argument("y1", type=int, help="The y-coordinate of the top-left corner of the crop area post rotation.")
+    sub.add_argument("x2", type=int, help="The x-coordinate of the bottom-right corner of the crop area post rotation.")
+    sub.add_argument("y2", type=int, help="The y-coordinate of the bottom-right corner of the crop area post rotation.")
+    sub.add_argument("angle", type=float, help="The angle of rotation for the crop area.")
+    sub.add_argument("--output_name", "-o", type=str, default=None, help="Name of the output video file (default: '<video_name>_rotcrop.mp4')")
+
+    sub = subparsers.add_parser("crop-dataset", help="Crop images and update CSV and HDF5 files.")
+    sub.set_defaults(module="cropping_dataset", function="crop_datasets", run=run_crop_dataset)
+    sub.add_argument('folder', type=str, help='The folder containing the files.')
+    sub.add_argument('x1', type=int, help='The x-coordinate of the top-left corner of the crop area post rotation.')
+    sub.add_argument('y1', type=int, help='The y-coordinate of the top-left corner of the crop area post rotation.')
+    sub.add_argument('x2', type=int, help='The x-coordinate of the bottom-right corner of the crop area post rotation.')
+    sub.add_argument('y2', type=int, help='The y-coordinate of the bottom-right corner of the crop area post rotation.')
+    sub.add_argument('angle', type=float, help='The angle of rotation for the crop area.')
+    sub.add_argument('--output_folder', '-o', type=str, help='Optional output folder to save the modified files.')
+    sub.add_argument('--dot_debug', '-d', action='store_true', help='Optional debugging mode to output images with dots on them to verify outputs')
+
+    sub = subparsers.add_parser("augment", help="Augment image dataset with color transformations and optional grayscale conversion.")
+    sub.set_defaults(module="image_augmentation", function="augment_dataset", run=run_augment)
+    sub.add_argument('input_folder', type=str, help="Path to the input folder containing images.")
+    sub.add_argument('output_folder', type=str, help="Path to the output folder to save augmented images.")
+    sub.add_argument('--num_augmentations', type=int, default=5, help="Number of augmentations to perform per image.")
+    sub.add_argument('--seed', type=int, default=42, help="seed for random number generator.")
+    sub.add_argument('--include_grayscale', action='store_true', help="Include grayscale conversion of images.")
+
+    sub = subparsers.add_parser("pull-and-process", help="Download videos with rclone and extract clips (configured via environment variables).")
+    sub.set_defaults(module="pull_and_process", function="main", run=run_pull_and_process)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    function = getattr(importlib.import_module(args.module), args.function)
+    if args.timing:
+        print(f"{args.command} startup: {time.perf_counter() - _START:.3f} s", file=sys.stderr)
+    args.run(function, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,6 @@
 import os
-import pandas as pd
 import numpy as np
 from PIL import Image, ImageDraw
-from scipy.ndimage import affine_transform
 import argparse
 
 def get_rotation_matrix(angle):
@@ -40,6 +38,9 @@ def crop_datasets(folder_path, angle, x1, y1, x2, y2, output_folder=None, debug_
     Raises:
     FileNotFoundError: If CSV or HDF5 file is not found in the specified folder.
     """
+    # pandas is slow to import, so only load it once there is work for it to do
+    import pandas as pd
+
     csv_path = None
     h5_path = None
 
@@ -139,6 +140,7 @@ def crop_datasets(folder_path, angle, x1, y1, x2, y2, output_folder=None, debug_
     print("Cropping and updates complete.")
 
 if __name__ == "__main__":
+    # These options are mirrored by the crop-dataset subcommand in cli.py, keep both in sync
     parser = argparse.ArgumentParser(description='Crop images and update CSV and HDF5 files.')
     parser.add_argument('folder', type=str, help='The folder containing the files.')
     parser.add_argument('x1', type=int, help='The x-coordinate of the top-left corner of the crop area post rotation.')
@@ -147,7 +149,7 @@ if __name__ == "__main__":
     parser.add_argument('y2', type=int, help='The y-coordinate of the bottom-right corner of the crop area post rotation.')
     parser.add_argument('angle', type=float, help='The angle of rotation for the crop area.')
     parser.add_argument('--output_folder', '-o', type=str, help='Optional output folder to save the modified files.')
-    parser.add_argument('--dot_debug', '-d', type=bool, help='Optional debugging mode to output images with dots on them to verify outputs')
+    parser.add_argument('--dot_debug', '-d', action='store_true', help='Optional debugging mode to output images with dots on them to verify outputs')
 
     args = parser.parse_args()
     
@@ -29,6 +29,7 @@ Functions:
 """
 
 def parse_args():
+    # These options are mirrored by the augment subcommand in cli.py, keep both in sync
     parser = argparse.ArgumentParser(description="Augment image dataset with color transformations and optional grayscale conversion.")
     parser.add_argument('input_folder', type=str, help="Path to the input folder containing images.")
     parser.add_argument('output_folder', type=str, help="Path to the output folder to save augmented images.")
@@ -19,6 +19,7 @@ Global Variables:
 - VIDEO_THRESHOLD_SIZE: Size threshold for the videos to be processed (~10 hours in Bytes).
 - JUST_FOLDERS: List of folders to exclusively process, if specified.
 - SKIP_FOLDERS: List of folders to skip during processing. (ignored if JUST_FOLDERS is not None)
+- SAVE_PLOTS: Whether to save the average pixel change plot for each video (set to 0 to skip).
 
 Functions:
 - list_files(remote_path): Lists files in a remote directory using rclone.
@@ -47,6 +48,7 @@ DOWNLOAD_FOLDER = os.getenv('DOWNLOAD_FOLDER', '/storage/home/hcoda1/0/athomas31
 VIDEO_THRESHOLD_SIZE = int(os.getenv('VIDEO_THRESHOLD_SIZE', 30000000000))  # ~10 hours in Bytes
 JUST_FOLDERS = os.getenv('JUST_FOLDERS', 'YH_s1_tr1_BowerBuilding').split(',')
 SKIP_FOLDERS = os.getenv('SKIP_FOLDERS', 'YH_s1_tr1_BowerBuilding,YH_s1_tr2_BowerBuilding,YH_s2_tr1_BowerBuilding,YH_s2_tr2_BowerBuilding').split(',')
+SAVE_PLOTS = os.getenv('SAVE_PLOTS', '1') != '0'
 
 
 def list_files(remote_path):
@@ -115,7 +117,8 @@ def process_directory(directory_path):
                               dir=PLOT_DIR,
                               prefix=os.path.basename(directory_path)[:10],
                               clip_dir=CLIP_DIR,
-                              threshold_devs=0.75)
+                              threshold_devs=0.75,
+                              plot=SAVE_PLOTS)
                 delete_file(local_file_path)
                 # if n_clips > 5:
                 #     break  # Process until you have five clips per directory
@@ -50,6 +50,6 @@ export PATH=\$PATH:/storage/coda1/d-coc/0/athomas314/rclone/rclone-v1.66.0-linux
 export JUST_FOLDERS=${FOLDER}
 
 # Call the python script with the specified folder
-python /storage/home/hcoda1/0/athomas314/ondemand/CichlidBowerTracking/ImageProcessing/src/pull_and_process.py
+python /storage/home/hcoda1/0/athomas314/ondemand/CichlidBowerTracking/ImageProcessing/src/cli.py --timing pull-and-process
 EOT
 done
\ No newline at end of file